@@ -16,31 +16,70 @@ Usage:
   python download_pdfs_from_csv.py --input vision2030_corpus.csv --outdir pdfs --email you@domain.com
 
 Requirements:
-  pip install requests beautifulsoup4 pandas tqdm
+  pip install aiohttp aiofiles selectolax tqdm
 """
 import argparse
+import asyncio
+import collections
 import csv
+import functools
 import os
 import re
+import shelve
+import shutil
 import time
+from email.utils import formatdate
 from urllib.parse import urljoin, urlparse, quote_plus
 
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+import aiofiles
+import aiohttp
+import feedparser
+from selectolax.lexbor import LexborHTMLParser
 from tqdm import tqdm
 
 # ---------- Config ----------
 USER_AGENT_TEMPLATE = "vision2030-pdf-downloader/1.0 ({email})"
-SLEEP_BETWEEN = 0.8   # seconds between external requests (adjust as needed)
+SLEEP_BETWEEN = 0.8   # seconds between requests to the *same* host (adjust as needed)
 RETRIES = 2
 TIMEOUT = 30
+MAX_CONCURRENCY = 32  # in-flight rows (each spends most time in socket wait)
+MAX_PER_HOST = 4      # politeness cap per publisher host
+UNPAYWALL_CACHE = "unpaywall_cache.db"  # shelve of DOI -> (timestamp, pdf_url_or_None)
+UNPAYWALL_TTL_HIT = 7 * 86400   # re-ask weekly once we have a PDF URL
+UNPAYWALL_TTL_MISS = 86400      # known-misses retry daily (OA status changes)
+FLUSH_EVERY = 25      # flush the output CSV every N completed rows
+ARXIV_API = "http://export.arxiv.org/api/query"
+ARXIV_BATCH = 100     # arXiv ids resolved per id_list query
 # -------------------------
 
+# Opened in _download_all; duplicate DOIs within a run and across re-runs then
+# skip the Unpaywall round-trip entirely.
+_unpaywall_cache = None
+
+# Per-host pacing: rows hitting *different* hosts proceed unthrottled, while
+# consecutive requests to one host stay SLEEP_BETWEEN seconds apart. The event
+# loop is single-threaded so the reserve-then-sleep pattern needs no lock.
+_host_next_ok = collections.defaultdict(float)
+
+async def _host_throttle(url):
+    host = urlparse(url).netloc
+    now = time.monotonic()
+    wait = _host_next_ok[host] - now
+    _host_next_ok[host] = max(now, _host_next_ok[host]) + SLEEP_BETWEEN
+    if wait > 0:
+        await asyncio.sleep(wait)
+
+# Compiled once: the URL regex runs per landing page.
+_PDF_URL_RE = re.compile(r"(https?:\/\/[^\s'\"<>]+\.pdf)", re.IGNORECASE)
+
+# Unsafe filename chars and whitespace all map to "_" in one C-level
+# translate pass (runs of "_" are cosmetic, so no collapse pass needed).
+_FNAME_TRANS = str.maketrans({c: "_" for c in '\\/:"*?<>|\t\n\r\f\v '})
+
+@functools.lru_cache(maxsize=4096)
 def safe_filename(s, maxlen=200):
-    s = (s or "")[:maxlen]
-    s = re.sub(r'[\\/:"*?<>|]+', "_", s)
-    s = re.sub(r'\s+', "_", s).strip("_")
+    # memoized: sector folder names and duplicate DOIs recur constantly
+    s = (s or "")[:maxlen].translate(_FNAME_TRANS).strip("_")
     return s or "file"
 
 def is_doi_like(s):
@@ -48,62 +87,140 @@ def is_doi_like(s):
     s = s.strip()
     return s.startswith("10.") or "doi.org" in s.lower()
 
-def unpaywall_pdf_for_doi(doi, email, headers):
-    """Return a PDF URL from Unpaywall (url_for_pdf) or None."""
+# The folder set is tiny (one per sector/source), so remember what already
+# exists instead of paying stat+mkdir syscalls on every row.
+_mkdir_cache = set()
+
+def ensure_dir(p):
+    if p not in _mkdir_cache:
+        os.makedirs(p, exist_ok=True)
+        _mkdir_cache.add(p)
+
+def first_nonempty(row, *keys):
+    """Return the first truthy row value among keys, else ''."""
+    for k in keys:
+        v = row.get(k)
+        if v:
+            return v
+    return ""
+
+def _unpaywall_cached(doi):
+    """Return (hit, pdf_url_or_None) from the shelve cache, honoring TTLs."""
+    if _unpaywall_cache is None:
+        return False, None
+    entry = _unpaywall_cache.get(doi)
+    if entry is None:
+        return False, None
+    ts, pdf = entry
+    ttl = UNPAYWALL_TTL_HIT if pdf else UNPAYWALL_TTL_MISS
+    if time.time() - ts < ttl:
+        return True, pdf
+    return False, None
+
+async def unpaywall_pdf_for_doi(session, doi, email):
+    """Return a PDF URL from Unpaywall (url_for_pdf) or None. Results are cached by DOI."""
     if not doi or not email:
         return None
+    hit, cached = _unpaywall_cached(doi)
+    if hit:
+        return cached
+    pdf = None
     api = f"https://api.unpaywall.org/v2/{quote_plus(doi)}"
     try:
-        r = requests.get(api, params={"email": email}, headers=headers, timeout=20)
-        if r.status_code == 200:
-            j = r.json()
-            bol = j.get("best_oa_location") or {}
-            pdf = bol.get("url_for_pdf") or bol.get("url")
-            if pdf:
-                return pdf
-            for loc in j.get("oa_locations") or []:
-                if loc.get("url_for_pdf"):
-                    return loc.get("url_for_pdf")
-                if loc.get("url") and loc.get("url").lower().endswith(".pdf"):
-                    return loc.get("url")
+        await _host_throttle(api)
+        async with session.get(api, params={"email": email}) as r:
+            if r.status == 200:
+                j = await r.json()
+                bol = j.get("best_oa_location") or {}
+                pdf = bol.get("url_for_pdf") or bol.get("url")
+                if not pdf:
+                    for loc in j.get("oa_locations") or []:
+                        if loc.get("url_for_pdf"):
+                            pdf = loc.get("url_for_pdf")
+                            break
+                        if loc.get("url") and loc.get("url").lower().endswith(".pdf"):
+                            pdf = loc.get("url")
+                            break
+            if _unpaywall_cache is not None and r.status in (200, 404):
+                # store explicit misses too, so repeated DOIs don't re-ask
+                _unpaywall_cache[doi] = (time.time(), pdf)
     except Exception:
         pass
-    return None
-
-def extract_pdf_from_html(url, html):
-    """Parse HTML to find meta citation_pdf_url or <a href=*.pdf> or link rel alternate."""
+    return pdf
+
+# One combined selector so the tree is traversed a single time per page;
+# candidates are ranked meta > link > anchor as the nodes stream past. The
+# attribute filters run inside the C selector engine, so Python only ever
+# sees the handful of nodes that are actual candidates.
+_PDF_SELECTOR = ('meta[name="citation_pdf_url"], meta[name="pdf_url"], '
+                 'meta[property="citation_pdf_url"], meta[property="pdf_url"], '
+                 'link[type*="pdf" i], a[href$=".pdf" i], a[href*="download" i]')
+
+# Most publisher pages declare citation_pdf_url in <head>, well inside the
+# first few KB; cap how far we look for the </head> boundary.
+_HEAD_END_RE = re.compile(r"</head\s*>", re.IGNORECASE)
+_HEAD_SCAN_LIMIT = 262144
+
+# Landing pages are streamed instead of fully downloaded: parse after each
+# 16 KB chunk (the meta usually sits in <head>) and give up past the cap.
+_LANDING_CHUNK = 16384
+_LANDING_CAP = 262144
+
+def _scan_tree(url, html):
+    """One selector pass over parsed HTML, ranked meta > link > anchor."""
+    # Lexbor is a C parser and only builds the lightweight tree we need; it is
+    # far faster (and lighter) than a BeautifulSoup DOM on big landing pages.
     try:
-        soup = BeautifulSoup(html, "html.parser")
+        tree = LexborHTMLParser(html)
     except Exception:
         return None
 
-    # 1) meta tags
-    for name in ("citation_pdf_url", "pdf_url"):
-        tag = soup.find("meta", attrs={"name": name}) or soup.find("meta", attrs={"property": name})
-        if tag and tag.get("content"):
-            return urljoin(url, tag.get("content"))
-
-    # 2) <link rel="alternate" type="application/pdf" href="...">
-    for link in soup.find_all("link", href=True):
-        if "pdf" in (link.get("type") or "").lower():
-            return urljoin(url, link.get("href"))
-
-    # 3) <a href="...pdf">
-    for a in soup.find_all("a", href=True):
-        href = a["href"].strip()
-        if href.lower().endswith(".pdf"):
-            return urljoin(url, href)
-        if "download" in href.lower() and ("pdf" in href.lower() or "fulltext" in href.lower()):
-            return urljoin(url, href)
-
-    # 4) regex fallback
-    m = re.search(r"(https?:\/\/[^\s'\"<>]+\.pdf)", html, flags=re.IGNORECASE)
+    link_hit = None
+    anchor_hit = None
+    for node in tree.css(_PDF_SELECTOR):
+        tag = node.tag
+        if tag == "meta":
+            # highest priority; metas live in <head>, so exit immediately
+            content = node.attributes.get("content")
+            if content:
+                return urljoin(url, content)
+        elif tag == "link":
+            if link_hit is None and node.attributes.get("href"):
+                link_hit = node.attributes.get("href")
+        elif anchor_hit is None:
+            href = (node.attributes.get("href") or "").strip()
+            if href.lower().endswith(".pdf"):
+                anchor_hit = href
+            elif "download" in href.lower() and ("pdf" in href.lower() or "fulltext" in href.lower()):
+                anchor_hit = href
+    if link_hit:
+        return urljoin(url, link_hit)
+    if anchor_hit:
+        return urljoin(url, anchor_hit)
+    return None
+
+def extract_pdf_from_html(url, html):
+    """Parse HTML to find meta citation_pdf_url or <a href=*.pdf> or link rel alternate."""
+    # Short-circuit huge landing pages: parse just the <head> prefix first and
+    # only parse the full document (then the raw regex) when that misses.
+    head_end = _HEAD_END_RE.search(html, 0, _HEAD_SCAN_LIMIT)
+    if head_end is not None and head_end.end() < len(html):
+        hit = _scan_tree(url, html[:head_end.end()])
+        if hit:
+            return hit
+
+    hit = _scan_tree(url, html)
+    if hit:
+        return hit
+
+    # regex fallback only when no structural candidate was found
+    m = _PDF_URL_RE.search(html)
     if m:
         return m.group(1)
 
     return None
 
-def try_doi_content_negotiation(doi, headers):
+async def try_doi_content_negotiation(session, doi):
     """Try doi.org Accept: application/pdf; return final URL if PDF or None."""
     if not doi:
         return None
@@ -114,31 +231,32 @@ def try_doi_content_negotiation(doi, headers):
     else:
         doi_url = "https://doi.org/" + doi
     try:
-        r = requests.get(doi_url, headers={**headers, "Accept":"application/pdf"}, stream=True, timeout=TIMEOUT, allow_redirects=True)
-        ctype = (r.headers.get("Content-Type") or "").lower()
-        final = r.url or doi_url
-        if "pdf" in ctype or final.lower().endswith(".pdf"):
-            return final
-        # check first bytes
-        first = r.raw.read(4)
-        r.raw.close()
-        if first == b'%PDF':
-            return final
+        await _host_throttle(doi_url)
+        async with session.get(doi_url, headers={"Accept": "application/pdf"}, allow_redirects=True) as r:
+            ctype = (r.headers.get("Content-Type") or "").lower()
+            final = str(r.url) or doi_url
+            if "pdf" in ctype or final.lower().endswith(".pdf"):
+                return final
+            # check first bytes
+            first = await r.content.read(4)
+            if first == b'%PDF':
+                return final
     except Exception:
         pass
     return None
 
-def head_is_pdf(url, headers):
+async def head_is_pdf(session, url):
     try:
-        h = requests.head(url, headers=headers, allow_redirects=True, timeout=TIMEOUT)
-        ctype = (h.headers.get("Content-Type") or "").lower()
-        if "pdf" in ctype:
-            return h.url
+        await _host_throttle(url)
+        async with session.head(url, allow_redirects=True) as h:
+            ctype = (h.headers.get("Content-Type") or "").lower()
+            if "pdf" in ctype:
+                return str(h.url)
     except Exception:
         pass
     return None
 
-def resolve_pdf_url(row, email, headers):
+async def resolve_pdf_url(session, row, email):
     """
     Given a row (dict-like with keys 'pdf_url', 'doi', 'source', 'id', 'title'), attempt to resolve a usable pdf URL.
     Returns (pdf_url_or_None, method_string)
@@ -149,7 +267,7 @@ def resolve_pdf_url(row, email, headers):
         return pdf, "csv_pdf_url"
 
     # 2) arXiv quick construct (if source is arxiv and id looks like arXiv)
-    source = (row.get("source") or "").lower()
+    source = row.get("source") or ""  # pre-lowered by _process_one's normalizer
     if source == "arxiv":
         # id may be in 'id' column like http://arxiv.org/abs/xxxx or 'id' contains arXiv id
         ident = row.get("id") or row.get("article_id") or ""
@@ -168,13 +286,13 @@ def resolve_pdf_url(row, email, headers):
     # 3) Unpaywall by DOI
     doi = row.get("doi") or ""
     if doi and email:
-        up = unpaywall_pdf_for_doi(doi, email, headers)
+        up = await unpaywall_pdf_for_doi(session, doi, email)
         if up:
             return up, "unpaywall"
 
     # 4) DOI content-negotiation
     if doi and is_doi_like(doi):
-        dn = try_doi_content_negotiation(doi, headers)
+        dn = await try_doi_content_negotiation(session, doi)
         if dn:
             return dn, "doi_negotiation"
 
@@ -187,22 +305,34 @@ def resolve_pdf_url(row, email, headers):
     # Keep any URL-like candidates from row
     # Try HEAD check first
     for c in candidates:
-        hpdf = head_is_pdf(c, headers)
+        hpdf = await head_is_pdf(session, c)
         if hpdf:
             return hpdf, "head_pdf_candidate"
     # 6) landing page GET and parse HTML
-    # try candidates again but GET and parse
+    # try candidates again but GET, streaming the body: most matches appear in
+    # the first 16 KB, so the connection closes long before multi-MB pages end
     for c in candidates:
         try:
-            r = requests.get(c, headers=headers, timeout=TIMEOUT)
-            ctype = (r.headers.get("Content-Type") or "").lower()
-            final_url = r.url
-            if "pdf" in ctype or final_url.lower().endswith(".pdf"):
-                return final_url, "landing_direct_pdf"
-            pdf_from_html = extract_pdf_from_html(final_url, r.text)
+            await _host_throttle(c)
+            pdf_from_html = None
+            async with session.get(c) as r:
+                ctype = (r.headers.get("Content-Type") or "").lower()
+                final_url = str(r.url)
+                if "pdf" in ctype or final_url.lower().endswith(".pdf"):
+                    return final_url, "landing_direct_pdf"
+                enc = r.charset or "utf-8"
+                buf = b""
+                while len(buf) < _LANDING_CAP:
+                    chunk = await r.content.read(_LANDING_CHUNK)
+                    if not chunk:
+                        break
+                    buf += chunk
+                    pdf_from_html = extract_pdf_from_html(final_url, buf.decode(enc, errors="replace"))
+                    if pdf_from_html:
+                        break
             if pdf_from_html:
                 # optionally verify via HEAD
-                verified = head_is_pdf(pdf_from_html, headers)
+                verified = await head_is_pdf(session, pdf_from_html)
                 return (verified or pdf_from_html), "landing_parsed"
         except Exception:
             continue
@@ -210,85 +340,136 @@ def resolve_pdf_url(row, email, headers):
     # 7) nothing found
     return None, "no_pdf_found"
 
-def download_stream_and_validate(url, out_path, headers):
-    """Stream download; validate pdf by checking first bytes for '%PDF' or URL ending with .pdf."""
+async def _existing_pdf_is_fresh(session, url, out_path):
+    """
+    If out_path exists from a prior run, revalidate it with a conditional HEAD
+    (If-None-Match from the sidecar's ETag, else If-Modified-Since from the
+    sidecar's Last-Modified, else the file mtime). Returns True when the local
+    copy can be reused without transferring bytes.
+    """
+    if not os.path.exists(out_path) or os.path.getsize(out_path) == 0:
+        return False
+    # never trust a file we haven't looked at: a crashed earlier run may have
+    # left garbage behind, and a conditional HEAD can't detect that
+    try:
+        with open(out_path, "rb") as f:
+            if f.read(4) != b"%PDF":
+                return False
+    except OSError:
+        return False
+    cond = {}
+    try:
+        # sidecar line 1: ETag, line 2: Last-Modified (either may be empty)
+        with open(out_path + ".etag", "r", encoding="utf-8") as f:
+            etag, _, last_mod = f.read().partition("\n")
+        if etag.strip():
+            cond["If-None-Match"] = etag.strip()
+        elif last_mod.strip():
+            # the server's own timestamp; the local mtime postdates it and
+            # would make a 304 trivially likely even for a changed resource
+            cond["If-Modified-Since"] = last_mod.strip()
+    except OSError:
+        pass
+    if not cond:
+        cond["If-Modified-Since"] = formatdate(os.path.getmtime(out_path), usegmt=True)
+    try:
+        await _host_throttle(url)
+        async with session.head(url, headers=cond, allow_redirects=True) as h:
+            if h.status == 304:
+                return True
+            if h.status == 200 and cond.get("If-None-Match") and h.headers.get("ETag") == cond["If-None-Match"]:
+                return True
+    except Exception:
+        # HEAD-hostile or unreachable host: trust the local file; it carried
+        # the %PDF magic above
+        return True
+    return False
+
+async def download_stream_and_validate(session, url, out_path):
+    """Stream download; validate pdf by checking first bytes for '%PDF' or URL ending with .pdf.
+
+    The body streams into out_path + ".part" and is renamed into place only
+    once fully written, so an aborted transfer never leaves a truncated file
+    at out_path for the resume/revalidation logic to pick up.
+    """
+    tmp_path = out_path + ".part"
     try:
-        with requests.get(url, headers=headers, stream=True, timeout=TIMEOUT, allow_redirects=True) as r:
+        await _host_throttle(url)
+        async with session.get(url, allow_redirects=True) as r:
             r.raise_for_status()
-            it = r.iter_content(chunk_size=4096)
-            try:
-                first = next(it)
-            except StopIteration:
+            first = await r.content.read(65536)
+            if not first:
                 return False, "empty_response"
-            final = r.url or url
-            # Validate: either filename ends with .pdf or first bytes contain %PDF
-            if not (final.lower().endswith(".pdf") or first[:4] == b'%PDF' or b'%PDF' in first):
+            final = str(r.url) or url
+            # Validate: prefix check first (no slicing/allocation), tuple-suffix
+            # match without lowercasing the URL, then a bounded magic scan
+            if not (first.startswith(b"%PDF")
+                    or final.endswith((".pdf", ".PDF"))
+                    or first.find(b"%PDF", 0, 1024) != -1):
                 return False, "not_pdf"
-            # write out
-            with open(out_path, "wb") as f:
-                f.write(first)
-                for chunk in it:
-                    if chunk:
-                        f.write(chunk)
+            # write out via aiofiles so disk I/O does not block the event loop;
+            # readany() drains whatever the TCP buffer has in one go instead of
+            # ticking the loop every fixed-size 4 KB chunk
+            async with aiofiles.open(tmp_path, "wb") as f:
+                await f.write(first)
+                while True:
+                    chunk = await r.content.readany()
+                    if not chunk:
+                        break
+                    await f.write(chunk)
+            os.replace(tmp_path, out_path)
+            # sidecar validators so later runs can revalidate with a HEAD;
+            # kept separate so Last-Modified is never replayed as an etag
+            etag = r.headers.get("ETag") or ""
+            last_mod = r.headers.get("Last-Modified") or ""
+            if etag or last_mod:
+                with open(out_path + ".etag", "w", encoding="utf-8") as f:
+                    f.write(etag + "\n" + last_mod)
         return True, None
-    except requests.HTTPError as e:
-        return False, f"http_error_{e.response.status_code}"
+    except aiohttp.ClientResponseError as e:
+        return False, f"http_error_{e.status}"
     except Exception as e:
         return False, str(e)
+    finally:
+        # gone already on success (renamed); a leftover means we aborted
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
 
 # ---------- Main orchestration ----------
-def process_csv(input_csv, out_dir, email=None, cols_map=None, max_rows=None):
+async def _process_one(session, sem, idx, row, email, out_dir, prefetched_pdf=None):
     """
-    Read CSV into pandas, iterate rows, attempt to download, and write updated CSV with new columns.
-    cols_map: optional dict mapping expected column names in CSV to canonical names:
-       e.g. {"pdf_url":"pdf_url", "doi":"doi", "title":"title", "source":"source", "assigned_sectors":"assigned_sectors", "id":"id"}
+    Resolve and download the PDF for a single CSV row (dict).
+    Returns (idx, pdf_url_used, saved_path, error) for reassembly in row order.
+    prefetched_pdf carries a link already resolved in bulk (arXiv id_list).
     """
-    df = pd.read_csv(input_csv, dtype=str).fillna("")
-    if max_rows:
-        df = df.iloc[:max_rows]
-
-    # canonical column names
-    def getcol(r, names):
-        for n in names:
-            if n in r:
-                return r[n]
-        return ""
-
-    # prepare output columns
-    out_pdf_url_used = []
-    out_saved_path = []
-    out_error = []
-    headers = {"User-Agent": USER_AGENT_TEMPLATE.format(email=email or "no-email")}
-
-    os.makedirs(out_dir, exist_ok=True)
-
-    for idx, row in tqdm(df.iterrows(), total=len(df), desc="Downloading"):
-        row = row.to_dict()
-        # build a small normalized dict to pass to resolver
-        norm = {
-            "pdf_url": row.get("pdf_url") or row.get("pdf") or "",
-            "doi": row.get("doi") or "",
-            "source": row.get("source") or "",
-            "id": row.get("id") or "",
-            "title": row.get("title") or row.get("display_name") or "",
-            "openalex_pdf": row.get("openalex_pdf") or row.get("best_pdf") or "",
-            "best_pdf": row.get("best_pdf") or "",
-            "landing_url": row.get("landing_url") or ""
-        }
-
-        pdf_url_used = ""
-        saved_path = ""
-        error = ""
-
+    # build a small normalized dict to pass to resolver
+    norm = {
+        "pdf_url": prefetched_pdf or first_nonempty(row, "pdf_url", "pdf"),
+        "doi": first_nonempty(row, "doi"),
+        "source": first_nonempty(row, "source").lower(),
+        "id": first_nonempty(row, "id"),
+        "title": first_nonempty(row, "title", "display_name"),
+        "openalex_pdf": first_nonempty(row, "openalex_pdf", "best_pdf"),
+        "best_pdf": first_nonempty(row, "best_pdf"),
+        "landing_url": first_nonempty(row, "landing_url")
+    }
+
+    pdf_url_used = ""
+    saved_path = ""
+    error = ""
+
+    async with sem:
         # Try resolution with retries
         resolved = None
         method = None
         for attempt in range(RETRIES + 1):
             try:
-                resolved, method = resolve_pdf_url(norm, email=email, headers=headers)
+                resolved, method = await resolve_pdf_url(session, norm, email=email)
                 break
             except Exception as e:
-                time.sleep(1)
+                await asyncio.sleep(1)
                 resolved = None
                 method = f"resolve_error_{str(e)}"
         if resolved:
@@ -302,17 +483,19 @@ def process_csv(input_csv, out_dir, email=None, cols_map=None, max_rows=None):
                 folder = (row.get("source") or "other").split(";")[0]
             # safe folder and filename
             save_dir = os.path.join(out_dir, safe_filename(folder))
-            os.makedirs(save_dir, exist_ok=True)
+            ensure_dir(save_dir)
             # filename from DOI if present else title
             doi = norm["doi"] or ""
-            fname_base = None
             if doi:
                 fname_base = safe_filename(doi)
             else:
                 fname_base = safe_filename(norm["title"][:120])
             out_file = os.path.join(save_dir, fname_base + ".pdf")
 
-            ok, err = download_stream_and_validate(pdf_url_used, out_file, headers=headers)
+            if await _existing_pdf_is_fresh(session, pdf_url_used, out_file):
+                return idx, pdf_url_used, out_file, ""
+
+            ok, err = await download_stream_and_validate(session, pdf_url_used, out_file)
             if ok:
                 saved_path = out_file
             else:
@@ -321,11 +504,14 @@ def process_csv(input_csv, out_dir, email=None, cols_map=None, max_rows=None):
                 if "doi_negotiation" in method or "unpaywall" in method or "landing" in method or "csv_pdf_url" in method:
                     # attempt GET landing/page and parse for pdf
                     try:
-                        r = requests.get(pdf_url_used, headers=headers, timeout=TIMEOUT)
-                        cand = extract_pdf_from_html(r.url, r.text)
+                        await _host_throttle(pdf_url_used)
+                        async with session.get(pdf_url_used) as r:
+                            final_url = str(r.url)
+                            text = await r.text()
+                        cand = extract_pdf_from_html(final_url, text)
                         if cand:
                             pdf_url_used = cand
-                            ok2, err2 = download_stream_and_validate(pdf_url_used, out_file, headers=headers)
+                            ok2, err2 = await download_stream_and_validate(session, pdf_url_used, out_file)
                             if ok2:
                                 saved_path = out_file
                                 error = ""
@@ -334,20 +520,189 @@ def process_csv(input_csv, out_dir, email=None, cols_map=None, max_rows=None):
         else:
             error = method or "no_pdf_found"
 
-        # Append outputs
-        out_pdf_url_used.append(pdf_url_used or "")
-        out_saved_path.append(saved_path or "")
-        out_error.append(error or "")
+    return idx, pdf_url_used or "", saved_path or "", error or ""
+
+_ARXIV_VERSION_RE = re.compile(r"v\d+$")
+
+def _arxiv_id(ident):
+    """Extract a bare, version-stripped arXiv id from an abs URL or arXiv:xxxx form."""
+    if "arxiv.org/abs/" in ident:
+        aid = ident.split("/abs/", 1)[1]
+    elif ident.startswith("arXiv:"):
+        aid = ident.split(":", 1)[1]
+    else:
+        return ""
+    return _ARXIV_VERSION_RE.sub("", aid.strip().strip("/"))
+
+async def _batch_resolve_arxiv(session, rows):
+    """
+    Resolve pdf links for arXiv rows in bulk: one id_list query validates up to
+    ARXIV_BATCH ids and returns their PDF links, replacing per-row probing.
+    Ids missing from the response (e.g. withdrawn) keep the constructed fallback.
+
+    Returns {id(row): pdf_url}; the rows themselves are left untouched so no
+    key outside the reader's fieldnames ever reaches the DictWriter.
+    """
+    links = {}
+    pending = {}
+    for idx, row in rows:
+        if (row.get("source") or "").lower() == "arxiv" and not (row.get("pdf_url") or row.get("pdf")):
+            aid = _arxiv_id(row.get("id") or row.get("article_id") or "")
+            if aid:
+                pending.setdefault(aid, []).append(row)
+    aids = list(pending)
+    for i in range(0, len(aids), ARXIV_BATCH):
+        batch = aids[i:i + ARXIV_BATCH]
+        try:
+            await _host_throttle(ARXIV_API)
+            async with session.get(ARXIV_API, params={"id_list": ",".join(batch),
+                                                      "max_results": str(len(batch))}) as r:
+                feed_bytes = await r.read()
+        except Exception:
+            continue
+        feed = feedparser.parse(feed_bytes)
+        for e in feed.entries:
+            aid = _arxiv_id(e.get("id", ""))
+            pdf = None
+            for l in e.get("links", []):
+                if l.get("type") == "application/pdf" or l.get("title") == "pdf":
+                    pdf = l.get("href")
+                    break
+            if pdf:
+                for row in pending.get(aid, []):
+                    links[id(row)] = pdf
+    return links
+
+async def _download_all(rows, email, out_dir, on_row):
+    """
+    Run all rows concurrently on one event loop. Each completed row is handed
+    to on_row(row, (pdf_url_used, saved_path, error)) as it finishes, so the
+    caller can persist progress incrementally.
+    """
+    headers = {"User-Agent": USER_AGENT_TEMPLATE.format(email=email or "no-email")}
+    # limit_per_host keeps per-publisher politeness; the semaphore bounds total
+    # in-flight rows so thousands of tasks don't all open sockets at once.
+    connector = aiohttp.TCPConnector(limit=64, limit_per_host=MAX_PER_HOST)
+    timeout = aiohttp.ClientTimeout(total=TIMEOUT * 4, sock_read=TIMEOUT)
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+    progress = tqdm(total=len(rows), desc="Downloading")
+
+    async def run_one(idx, row):
+        res = await _process_one(session, sem, idx, row, email, out_dir,
+                                 prefetched_pdf=arxiv_links.get(id(row)))
+        on_row(row, res[1:])
+        progress.update(1)
+
+    global _unpaywall_cache
+    _unpaywall_cache = shelve.open(UNPAYWALL_CACHE)
+    try:
+        async with aiohttp.ClientSession(connector=connector, headers=headers, timeout=timeout) as session:
+            arxiv_links = await _batch_resolve_arxiv(session, rows)
+            async with asyncio.TaskGroup() as tg:
+                for idx, row in rows:
+                    tg.create_task(run_one(idx, row))
+    finally:
+        _unpaywall_cache.close()
+        _unpaywall_cache = None
+        progress.close()
+
+def _replicate_saved(row, saved_path, out_dir):
+    """
+    Hard-link (copy if cross-device) an already-downloaded PDF into this row's
+    sector folder, so duplicate DOIs never re-download bytes.
+    """
+    if not saved_path or not os.path.exists(saved_path):
+        return ""
+    assigned = (row.get("assigned_sectors") or "") or (row.get("query_sector") or "")
+    folder = (assigned or (row.get("source") or "other")).split(";")[0]
+    save_dir = os.path.join(out_dir, safe_filename(folder))
+    ensure_dir(save_dir)
+    target = os.path.join(save_dir, os.path.basename(saved_path))
+    if target != saved_path and not os.path.exists(target):
+        try:
+            os.link(saved_path, target)
+        except OSError:
+            shutil.copyfile(saved_path, target)
+    return target
+
+def process_csv(input_csv, out_dir, email=None, cols_map=None, max_rows=None):
+    """
+    Stream the CSV with csv.DictReader (no pandas DataFrame materialization),
+    download all rows concurrently, and write an updated CSV with new columns.
+    Rows are flushed to the output CSV as they complete, so a crash keeps the
+    finished work and a re-run only processes the rows still missing a PDF.
+    cols_map: optional dict mapping expected column names in CSV to canonical names:
+       e.g. {"pdf_url":"pdf_url", "doi":"doi", "title":"title", "source":"source", "assigned_sectors":"assigned_sectors", "id":"id"}
+    """
+    with open(input_csv, newline="", encoding="utf-8", buffering=1 << 20) as f:
+        reader = csv.DictReader(f)
+        fieldnames = list(reader.fieldnames or [])
+        raw_rows = [{k: (v or "") for k, v in row.items()} for row in reader]
+    if max_rows:
+        raw_rows = raw_rows[:max_rows]
 
-        # polite sleep between iterations
-        time.sleep(SLEEP_BETWEEN)
+    ensure_dir(out_dir)
 
-    # write new CSV with added columns
-    df["pdf_url_used"] = out_pdf_url_used
-    df["saved_path"] = out_saved_path
-    df["download_error"] = out_error
     out_csv = os.path.splitext(input_csv)[0] + "_with_pdfs.csv"
-    df.to_csv(out_csv, index=False, encoding="utf-8")
+    out_fields = fieldnames + [c for c in ("pdf_url_used", "saved_path", "download_error")
+                               if c not in fieldnames]
+
+    # Resume support: rows already saved in a previous (partial) output are
+    # re-emitted without any network work.
+    done = {}
+    if os.path.exists(out_csv):
+        with open(out_csv, newline="", encoding="utf-8") as f:
+            for prev in csv.DictReader(f):
+                if prev.get("saved_path"):
+                    key = (prev.get("doi") or "", prev.get("id") or "")
+                    done[key] = (prev.get("pdf_url_used") or "",
+                                 prev.get("saved_path") or "",
+                                 prev.get("download_error") or "")
+
+    with open(out_csv, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=out_fields)
+        writer.writeheader()
+        n_written = 0
+
+        # Rows sharing a DOI are resolved once; followers get the result
+        # replicated (hard-linked into their own sector folder) on completion.
+        doi_followers = {}
+
+        def emit(row, result):
+            nonlocal n_written
+            pdf_url_used, saved_path, error = result
+            row["pdf_url_used"] = pdf_url_used
+            row["saved_path"] = saved_path
+            row["download_error"] = error
+            writer.writerow(row)
+            n_written += 1
+            doi = (row.get("doi") or "").lower().strip()
+            for dup in doi_followers.pop(doi, []):
+                dup["pdf_url_used"] = pdf_url_used
+                dup["saved_path"] = _replicate_saved(dup, saved_path, out_dir)
+                dup["download_error"] = error
+                writer.writerow(dup)
+                n_written += 1
+            if n_written % FLUSH_EVERY == 0:
+                f.flush()
+
+        todo = []
+        for idx, row in enumerate(raw_rows):
+            key = (row.get("doi") or "", row.get("id") or "")
+            if key in done:
+                emit(row, done[key])
+                continue
+            doi = (row.get("doi") or "").lower().strip()
+            if doi and doi in doi_followers:
+                doi_followers[doi].append(row)
+                continue
+            if doi:
+                doi_followers[doi] = []
+            todo.append((idx, row))
+
+        if todo:
+            asyncio.run(_download_all(todo, email, out_dir, on_row=emit))
+        f.flush()
     print(f"\nWrote updated CSV with download results: {out_csv}")
     return out_csv
 
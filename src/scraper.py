@@ -24,41 +24,135 @@ Requirements:
 """
 
 import argparse
+import atexit
 import csv
+import hashlib
+import json
+import logging
+import logging.handlers
 import os
+import queue
 import re
+import shelve
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urljoin
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 
+try:
+    import lxml  # noqa: F401  (used by BeautifulSoup via the parser name)
+    BS4_PARSER = "lxml"
+except ImportError:
+    BS4_PARSER = "html.parser"
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import orjson
+    def _json_loads(raw):
+        return orjson.loads(raw)
+except ImportError:
+    def _json_loads(raw):
+        return json.loads(raw)
+
+log = logging.getLogger("scraper")
+
 # ---------- Configurable defaults ----------
 OPENALEX_TOPICS_URL = "https://api.openalex.org/topics"
 OPENALEX_WORKS_URL = "https://api.openalex.org/works"
 UNPAYWALL_API = "https://api.unpaywall.org/v2/"   # append DOI, params: email
 USER_AGENT_TEMPLATE = "openalex-downloader/1.0 ({email})"
+PAGE_WORKERS = 16     # concurrent PDF resolutions per OpenAlex page
+UNPAYWALL_CONCURRENCY = 8   # polite cap on in-flight Unpaywall lookups
+UNPAYWALL_CACHE = "unpaywall_cache.db"   # shelve file; reruns skip the API entirely
+UNPAYWALL_TTL = 30 * 86400               # OA status rarely changes; 30 days is safe
+CSV_FIELDS = ["openalex_id", "title", "doi", "publication_date", "pdf_url", "saved_file", "error", "topics", "journal"]
+CSV_FLUSH_EVERY = 100
+TOPICS_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "openalex")
+TOPICS_CACHE_TTL = 86400   # topic listings move slowly; a day of staleness is fine
+LANDING_HEAD_PROBE = 65536    # try extraction once this much of the page is in
+LANDING_CAP = 1 << 20         # never read more than 1 MiB of a landing page
 
 # ---------- Helpers ----------
+# compiled once: this runs for every landing page, and re.search with a
+# string pattern re-does a cache lookup on each call
+_RE_PDF_IN_HTML = re.compile(r"(https?:\/\/[^\s'\"<>]+\.pdf)", re.IGNORECASE)
+
+# one-pass C-level replacement of filesystem-unsafe and whitespace characters
+_FNAME_TRANS = str.maketrans({c: "_" for c in '\\/:"*?<>|\t\n\r\f\v '})
+
 def safe_filename(s):
-    s = re.sub(r'[\\/:"*?<>|]+', '_', s or '')
-    s = re.sub(r'\s+', '_', s.strip())
-    return s[:180]
+    return (s or '').strip().translate(_FNAME_TRANS)[:180]
 
-def fetch_candidate_topics(search_term="technology", per_page=50, max_topics=10, email=None):
+def make_session(email=None):
+    """
+    Build a pooled requests.Session shared by all HTTP calls. The same hosts
+    (api.openalex.org, api.unpaywall.org, doi.org, publishers) are hit
+    thousands of times, so keep-alive skips a TCP+TLS handshake per call.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=64,
+        pool_maxsize=64,
+        max_retries=Retry(total=5, backoff_factor=0.3,
+                          status_forcelist=[429, 500, 502, 503, 504],
+                          allowed_methods=["GET", "HEAD"],
+                          respect_retry_after_header=True),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        "User-Agent": USER_AGENT_TEMPLATE.format(email=email or "no-email"),
+        # advertise brotli ahead of gzip: JSON/HTML bodies shrink noticeably
+        # more, and urllib3 decodes it transparently when brotli is installed
+        "Accept-Encoding": "br, gzip, deflate",
+    })
+    return session
+
+def fetch_candidate_topics(search_term="technology", per_page=50, max_topics=10, email=None, session=None):
     """
     Query OpenAlex /topics for the search_term and return top max_topics sorted by works_count.
     Returns a list of dicts (id, display_name, works_count, keywords).
     """
     params = {"search": search_term, "per-page": per_page, "select": "id,display_name,description,keywords,works_count"}
-    headers = {"User-Agent": USER_AGENT_TEMPLATE.format(email=email or "no-email")}
+    session = session or make_session(email)
+
+    # repeated runs with the same search term hit a small on-disk cache
+    # instead of the network
+    key = hashlib.sha1(f"{search_term}|{per_page}".encode()).hexdigest()
+    cache_path = os.path.join(TOPICS_CACHE_DIR, f"topics_{key}.json")
+    data = None
     try:
-        r = requests.get(OPENALEX_TOPICS_URL, params=params, headers=headers, timeout=30)
-        r.raise_for_status()
-        data = r.json()
-    except Exception as e:
-        print("Failed to fetch topics from OpenAlex:", e)
-        return []
+        if time.time() - os.path.getmtime(cache_path) < TOPICS_CACHE_TTL:
+            with open(cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    if data is None:
+        try:
+            r = _api_get(OPENALEX_TOPICS_URL, session, params=params, timeout=30)
+            r.raise_for_status()
+            data = _json_loads(r.content)
+        except Exception as e:
+            log.warning("Failed to fetch topics from OpenAlex: %s", e)
+            return []
+        try:
+            os.makedirs(TOPICS_CACHE_DIR, exist_ok=True)
+            tmp = cache_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, cache_path)
+        except OSError:
+            pass
 
     topics = data.get("results", []) or []
     topics_sorted = sorted(topics, key=lambda t: t.get("works_count", 0), reverse=True)
@@ -69,34 +163,150 @@ def is_doi_url(u):
     if not u:
         return False
     u = u.lower()
-    return "doi.org/" in u or re.match(r"^10\.\d+\/", u) is not None
-
-def unpaywall_pdf_for_doi(doi, email, headers):
-    """Return an OA pdf URL via Unpaywall (or None)."""
+    if "doi.org/" in u:
+        return True
+    # bare DOI: "10.<digits>/..." — plain string checks, no regex machinery
+    if u.startswith("10."):
+        slash = u.find("/", 3)
+        return slash > 3 and u[3:slash].isdigit()
+    return False
+
+_api_client = None
+_api_client_lock = threading.Lock()
+API_RETRY_TOTAL = 5          # mirror the session's urllib3 Retry policy
+API_RETRY_BACKOFF = 0.3
+_API_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+def _api_get(url, session, **kwargs):
+    """
+    GET an API endpoint (OpenAlex, Unpaywall). When httpx is installed the
+    call goes over a shared HTTP/2 client — both APIs support h2, and
+    multiplexing the many small JSON requests onto one connection beats
+    opening parallel HTTP/1.1 sockets. Publisher PDF traffic stays on the
+    requests session. Falls back to the session when httpx is missing.
+
+    httpx has no equivalent of urllib3's status Retry, so the h2 path runs
+    its own loop with the same shape: up to API_RETRY_TOTAL attempts on
+    429/5xx, honouring Retry-After and otherwise backing off exponentially.
+    Connect-level retries are handled by the transport.
+    """
+    global _api_client
+    if httpx is None:
+        return session.get(url, **kwargs)
+    if _api_client is None:
+        with _api_client_lock:
+            if _api_client is None:
+                _api_client = httpx.Client(
+                    transport=httpx.HTTPTransport(
+                        http2=True,
+                        retries=3,
+                        limits=httpx.Limits(max_connections=64),
+                    ),
+                    follow_redirects=True,
+                    headers=dict(session.headers),
+                )
+    for attempt in range(API_RETRY_TOTAL):
+        r = _api_client.get(url, **kwargs)
+        if r.status_code not in _API_RETRY_STATUSES or attempt == API_RETRY_TOTAL - 1:
+            return r
+        try:
+            wait = float(r.headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            wait = API_RETRY_BACKOFF * (2 ** attempt)
+        time.sleep(wait)
+    return r
+
+_unpaywall_mem = {}
+_unpaywall_lock = threading.Lock()
+_unpaywall_sem = threading.Semaphore(UNPAYWALL_CONCURRENCY)
+_unpaywall_db = None
+
+def _unpaywall_db_open():
+    global _unpaywall_db
+    if _unpaywall_db is None:
+        _unpaywall_db = shelve.open(UNPAYWALL_CACHE)
+        atexit.register(_unpaywall_db.close)
+    return _unpaywall_db
+
+def _unpaywall_cache_get(doi):
+    """Return (hit, pdf_or_None). Negative results are cached too (pdf=None);
+    expired entries report hit=False so they get refreshed."""
+    if doi in _unpaywall_mem:
+        return True, _unpaywall_mem[doi]
+    with _unpaywall_lock:
+        entry = _unpaywall_db_open().get(doi)
+    if entry is not None:
+        ts, pdf = entry
+        if time.time() - ts < UNPAYWALL_TTL:
+            _unpaywall_mem[doi] = pdf
+            return True, pdf
+    return False, None
+
+def _unpaywall_cache_put(doi, pdf):
+    _unpaywall_mem[doi] = pdf
+    with _unpaywall_lock:
+        _unpaywall_db_open()[doi] = (time.time(), pdf)
+
+def unpaywall_pdf_for_doi(doi, email, session):
+    """Return an OA pdf URL via Unpaywall (or None). Memoized in memory and
+    in a shelve file so the same DOI is never looked up twice."""
     if not doi or not email:
         return None
+    hit, pdf = _unpaywall_cache_get(doi)
+    if hit:
+        return pdf
     api = UNPAYWALL_API + doi
     try:
-        r = requests.get(api, params={"email": email}, headers=headers, timeout=20)
+        # more workers are resolving than Unpaywall should see at once; the
+        # semaphore keeps the extra parallelism on the publisher side
+        with _unpaywall_sem:
+            r = _api_get(api, session, params={"email": email}, timeout=20)
         if r.status_code == 200:
-            j = r.json()
+            j = _json_loads(r.content)
+            pdf = None
             bol = j.get("best_oa_location") or {}
             pdf = bol.get("url_for_pdf") or bol.get("url")
-            if pdf:
-                return pdf
-            for loc in j.get("oa_locations", []) or []:
-                if loc.get("url_for_pdf"):
-                    return loc.get("url_for_pdf")
-                if loc.get("url") and loc.get("url").lower().endswith(".pdf"):
-                    return loc.get("url")
+            if not pdf:
+                for loc in j.get("oa_locations", []) or []:
+                    if loc.get("url_for_pdf"):
+                        pdf = loc.get("url_for_pdf")
+                        break
+                    if loc.get("url") and loc.get("url").lower().endswith(".pdf"):
+                        pdf = loc.get("url")
+                        break
+            _unpaywall_cache_put(doi, pdf)
+            return pdf
+        if r.status_code == 404:
+            _unpaywall_cache_put(doi, None)
     except Exception:
         pass
     return None
 
+# fast-path patterns for extract_pdf_from_html: the vast majority of landing
+# pages expose the PDF via one of these three shapes, and a regex scan over the
+# raw text is far cheaper than building a parse tree
+RE_CITATION_PDF = re.compile(
+    r'<meta[^>]+?(?:name|property)=["\'](?:citation_pdf_url|pdf_url)["\'][^>]*?content=["\']([^"\']+)'
+    r'|<meta[^>]+?content=["\']([^"\']+)["\'][^>]*?(?:name|property)=["\'](?:citation_pdf_url|pdf_url)["\']',
+    re.IGNORECASE)
+RE_PDF_LINK = re.compile(r'<link[^>]+?type=["\'][^"\']*pdf[^"\']*["\'][^>]*?href=["\']([^"\']+)', re.IGNORECASE)
+RE_PDF_ANCHOR = re.compile(r'<a[^>]+?href=["\']([^"\']+?\.pdf(?:[?#][^"\']*)?)["\']', re.IGNORECASE)
+
 def extract_pdf_from_html(url, html_text):
     """Parse HTML for common PDF signals: meta citation_pdf_url, <link rel="alternate" type="application/pdf">, <a href="*.pdf">, regex fallback."""
+    m = RE_CITATION_PDF.search(html_text)
+    if m:
+        return urljoin(url, m.group(1) or m.group(2))
+    m = RE_PDF_LINK.search(html_text)
+    if m:
+        return urljoin(url, m.group(1))
+    m = RE_PDF_ANCHOR.search(html_text)
+    if m:
+        return urljoin(url, m.group(1))
+
+    # slow path: full parse for pages the patterns above miss
     try:
-        soup = BeautifulSoup(html_text, "html.parser")
+        soup = BeautifulSoup(html_text, BS4_PARSER)
     except Exception:
         return None
 
@@ -122,21 +332,21 @@ def extract_pdf_from_html(url, html_text):
             return urljoin(url, href)
 
     # regex fallback
-    m = re.search(r"(https?:\/\/[^\s'\"<>]+\.pdf)", html_text, flags=re.IGNORECASE)
+    m = _RE_PDF_IN_HTML.search(html_text)
     if m:
         return m.group(1)
 
     return None
 
-def try_resolve_pdf_url(candidate_url, doi=None, email=None, headers=None):
+def try_resolve_pdf_url(candidate_url, doi=None, email=None, session=None):
     """
     Given a candidate (OA location / DOI / landing page), try to resolve to a direct PDF URL.
     Returns pdf_url string or None.
     """
-    headers = headers or {}
+    session = session or make_session(email)
     # 1) Unpaywall by DOI (fast & reliable)
     if doi and email:
-        pdf = unpaywall_pdf_for_doi(doi, email, headers)
+        pdf = unpaywall_pdf_for_doi(doi, email, session)
         if pdf:
             return pdf
 
@@ -147,7 +357,7 @@ def try_resolve_pdf_url(candidate_url, doi=None, email=None, headers=None):
         else:
             doi_url = candidate_url if candidate_url.startswith("http") else "https://" + candidate_url
         try:
-            r = requests.get(doi_url, headers={**headers, "Accept": "application/pdf"}, stream=True, timeout=30, allow_redirects=True)
+            r = session.get(doi_url, headers={"Accept": "application/pdf"}, stream=True, timeout=30, allow_redirects=True)
             ctype = (r.headers.get("Content-Type") or "").lower()
             final = r.url or doi_url
             if "pdf" in ctype or final.lower().endswith(".pdf"):
@@ -163,59 +373,82 @@ def try_resolve_pdf_url(candidate_url, doi=None, email=None, headers=None):
     if not candidate_url:
         return None
 
-    # 3) HEAD quick-check for PDF content-type
-    try:
-        h = requests.head(candidate_url, headers=headers, allow_redirects=True, timeout=15)
-        ctype = (h.headers.get("Content-Type") or "").lower()
-        if "pdf" in ctype:
-            return h.url
-    except Exception:
-        pass
-
-    # 4) GET landing page and parse for PDF links/meta
+    # 3) Single streaming GET: its header sniff below covers what a separate
+    # HEAD probe used to check, without the extra round trip (and without
+    # tripping servers that mishandle HEAD).
+    # 4) GET landing page and parse for PDF links/meta. Stream so the
+    # content-type sniff only costs headers: if the URL turns out to be the
+    # PDF itself (or not HTML at all) the body is never pulled down here.
     try:
-        r = requests.get(candidate_url, headers=headers, timeout=30, allow_redirects=True)
-        r.raise_for_status()
-        ctype = (r.headers.get("Content-Type") or "").lower()
-        final_url = r.url
-        if "pdf" in ctype or final_url.lower().endswith(".pdf"):
-            return final_url
-        pdf_candidate = extract_pdf_from_html(final_url, r.text)
+        with session.get(candidate_url, stream=True, timeout=30, allow_redirects=True) as r:
+            r.raise_for_status()
+            ctype = (r.headers.get("Content-Type") or "").lower()
+            final_url = r.url
+            if "pdf" in ctype or final_url.lower().endswith(".pdf"):
+                return final_url
+            if "html" not in ctype:
+                return None
+            # read incrementally: the PDF signals almost always sit in
+            # <head>, so try extraction as soon as it has streamed in and
+            # stop early instead of pulling megabytes of article HTML
+            raw = b""
+            encoding = r.encoding or "utf-8"
+            pdf_candidate = None
+            probed = False
+            for chunk in r.iter_content(chunk_size=16384):
+                raw += chunk
+                if not probed and (b"</head" in raw or len(raw) >= LANDING_HEAD_PROBE):
+                    probed = True
+                    pdf_candidate = extract_pdf_from_html(final_url, raw.decode(encoding, "replace"))
+                    if pdf_candidate:
+                        break
+                if len(raw) >= LANDING_CAP:
+                    break
+        if not pdf_candidate:
+            pdf_candidate = extract_pdf_from_html(final_url, raw.decode(encoding, "replace"))
         if pdf_candidate:
-            try:
-                h2 = requests.head(pdf_candidate, headers=headers, allow_redirects=True, timeout=15)
-                c2 = (h2.headers.get("Content-Type") or "").lower()
-                if "pdf" in c2 or h2.url.lower().endswith(".pdf"):
-                    return h2.url
-            except Exception:
-                return pdf_candidate
+            # no verification round trip here: download_file_with_validation
+            # checks the %PDF magic bytes before keeping anything
+            return pdf_candidate
     except Exception:
         pass
 
     return None
 
-def download_file_with_validation(url, out_path, headers=None, timeout=40):
+def download_file_with_validation(url, out_path, session=None, timeout=40):
     """
     Download streaming; validate PDF by checking first bytes for '%PDF' or URL ending with .pdf.
     Returns (ok_bool, error_msg_or_None).
     """
-    headers = headers or {}
+    session = session or make_session()
     try:
-        with requests.get(url, headers=headers, stream=True, timeout=timeout, allow_redirects=True) as r:
+        with session.get(url, stream=True, timeout=timeout, allow_redirects=True) as r:
             r.raise_for_status()
-            it = r.iter_content(chunk_size=4096)
-            try:
-                first = next(it)
-            except StopIteration:
+            r.raw.decode_content = True
+            first = r.raw.read(65536)
+            if not first:
                 return False, "empty_response"
             final = r.url or url
             if not (final.lower().endswith(".pdf") or first[:4] == b'%PDF' or b'%PDF' in first):
                 return False, "not_pdf"
-            with open(out_path, "wb") as f:
+            # once validated, pump the body through one preallocated 1 MiB
+            # buffer into an unbuffered file: readinto avoids a fresh bytes
+            # object per chunk, and each MiB is a single write syscall.
+            # (True zero-copy sendfile/splice is off the table — the source
+            # is a TLS socket, so bytes must pass through userspace anyway.)
+            buf = bytearray(1 << 20)
+            view = memoryview(buf)
+            with open(out_path, "wb", buffering=0) as f:
                 f.write(first)
-                for chunk in it:
-                    if chunk:
-                        f.write(chunk)
+                while True:
+                    n = r.raw.readinto(view)
+                    if not n:
+                        break
+                    f.write(view[:n])
+                if hasattr(os, "posix_fadvise"):
+                    # downloaded PDFs are not re-read; don't let them evict
+                    # useful pages from the OS cache
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
         return True, None
     except requests.HTTPError as e:
         return False, f"http_error_{e.response.status_code}"
@@ -223,7 +456,105 @@ def download_file_with_validation(url, out_path, headers=None, timeout=40):
         return False, str(e)
 
 # ---------- Per-topic downloader ----------
-def download_for_topic(topic_id, topic_name, out_base="downloads", per_page=200, sleep=1.0, email=None, max_pages=None):
+_claimed_lock = threading.Lock()
+_claimed_paths = set()
+
+def _claim_path(path):
+    """First caller per run claims a target path; later callers (the same
+    DOI surfacing again) are told to skip it."""
+    with _claimed_lock:
+        if path in _claimed_paths:
+            return False
+        _claimed_paths.add(path)
+        return True
+
+def _valid_pdf_on_disk(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read(4) == b"%PDF"
+    except OSError:
+        return False
+
+def _process_work(w, seq, out_dir, topic_name, email, session):
+    """
+    Resolve and download the PDF for one OpenAlex work; returns the CSV row
+    dict. Runs on a worker thread — the whole body is network-bound, so a
+    page's works proceed in parallel instead of paying sum-of-latencies.
+    """
+    doi = w.get("doi")
+    title = w.get("display_name", "no-title")
+    filepath = os.path.join(out_dir, safe_filename(doi or title) + ".pdf")
+
+    pdf_url = None
+    filename = ""
+    error = ""
+    # cheapest checks first: a valid PDF already on disk, or a path another
+    # worker claimed this run, means no resolution or download at all
+    if _valid_pdf_on_disk(filepath):
+        filename = filepath
+        log.info("[%s] [%s] Already downloaded: %s", topic_name, seq, filepath)
+    elif not _claim_path(filepath):
+        error = "duplicate_work"
+    else:
+        # candidate from best_oa_location, then primary_location, then first locations entry
+        bol = w.get("best_oa_location") or {}
+        candidate = bol.get("url") or bol.get("pdf_url") or bol.get("landing_page_url")
+        if not candidate:
+            pl = w.get("primary_location") or {}
+            candidate = pl.get("url") or pl.get("pdf_url") or pl.get("landing_page_url")
+        if not candidate:
+            locs = w.get("locations") or []
+            if locs:
+                candidate = locs[0].get("url") or locs[0].get("pdf_url") or locs[0].get("landing_page_url")
+        pdf_url = try_resolve_pdf_url(candidate, doi=doi, email=email, session=session) if (candidate or doi) else None
+
+        if pdf_url:
+            ok, err = download_file_with_validation(pdf_url, filepath, session=session)
+            if ok:
+                filename = filepath
+                log.info("[%s] [%s] Saved: %s", topic_name, seq, filepath)
+            else:
+                error = err or "download_failed"
+                log.info("[%s] [%s] Failed to download %s => %s", topic_name, seq, pdf_url, error)
+        else:
+            error = "no_pdf_url_found"
+            log.info("[%s] [%s] No OA PDF/URL found for: %s", topic_name, seq, w.get("display_name")[:80])
+
+    topics_list = []
+    for t in (w.get("topics") or []):
+        try:
+            topics_list.append(t.get("display_name") or t.get("id"))
+        except Exception:
+            continue
+    b = w.get("biblio") or {}
+    journal = b.get("journal_title") or b.get("journal") or b.get("venue") or ""
+
+    # list in CSV_FIELDS order, fed straight to csv.writer
+    return [
+        w.get("id", ""),
+        w.get("display_name", ""),
+        doi or "",
+        w.get("publication_date", ""),
+        pdf_url or "",
+        filename,
+        error,
+        ";".join(topics_list),
+        journal or ""
+    ]
+
+def _fetch_works_page(session, params, topic_name, delay):
+    """Fetch one OpenAlex works page. Runs on the prefetch thread, so the
+    politeness delay overlaps with page processing. 429s and transient 5xxs
+    are retried with Retry-After-aware exponential backoff either way: by
+    _api_get's loop on the HTTP/2 path, or by the session's urllib3 Retry
+    policy on the fallback path."""
+    if delay:
+        time.sleep(delay)
+    r = _api_get(OPENALEX_WORKS_URL, session, params=params, timeout=60)
+    r.raise_for_status()
+    return _json_loads(r.content)
+
+def download_for_topic(topic_id, topic_name, out_base="downloads", per_page=200, sleep=1.0, email=None, max_pages=None, session=None):
     safe_topic_name = safe_filename(topic_name or topic_id)
     out_dir = os.path.join(out_base, safe_topic_name)
     os.makedirs(out_dir, exist_ok=True)
@@ -241,107 +572,81 @@ def download_for_topic(topic_id, topic_name, out_base="downloads", per_page=200,
         "cursor": "*",
         "select": select_fields
     }
-    headers = {"User-Agent": USER_AGENT_TEMPLATE.format(email=email or "no-email")}
+    session = session or make_session(email)
     total = 0
     page_count = 0
 
-    print(f"\n=== Topic: {topic_name} ({topic_id}) ===")
-    print("Saving into:", out_dir)
+    log.info("=== Topic: %s (%s) ===", topic_name, topic_id)
+    log.info("Saving into: %s", out_dir)
 
-    while True:
-        page_count += 1
-        print(f"[{topic_name}] Querying cursor: {params.get('cursor')} (page {page_count})")
-        try:
-            r = requests.get(OPENALEX_WORKS_URL, params=params, headers=headers, timeout=60)
-            if r.status_code == 429:
-                wait = int(r.headers.get("Retry-After", 30))
-                print(f"[{topic_name}] Rate limited, sleeping {wait}s")
-                time.sleep(wait)
-                continue
-            r.raise_for_status()
-            data = r.json()
-        except Exception as e:
-            print(f"[{topic_name}] Request failed:", e)
-            print("Sleeping 10s and retrying...")
-            time.sleep(10)
-            continue
-
-        if writer is None:
-            csvfile = open(csv_path, "w", newline="", encoding="utf-8")
-            fieldnames = ["openalex_id", "title", "doi", "publication_date", "pdf_url", "saved_file", "error", "topics", "journal"]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-
-        results = data.get("results", [])
-        for w in results:
-            total += 1
-            doi = w.get("doi")
-            # candidate from best_oa_location, then primary_location, then first locations entry
-            candidate = None
-            bol = w.get("best_oa_location") or {}
-            candidate = bol.get("url") or bol.get("pdf_url") or bol.get("landing_page_url")
-            if not candidate:
-                pl = w.get("primary_location") or {}
-                candidate = pl.get("url") or pl.get("pdf_url") or pl.get("landing_page_url")
-            if not candidate:
-                locs = w.get("locations") or []
-                if locs:
-                    candidate = locs[0].get("url") or locs[0].get("pdf_url") or locs[0].get("landing_page_url")
-            pdf_url = try_resolve_pdf_url(candidate, doi=doi, email=email, headers=headers) if (candidate or doi) else None
-
-            filename = ""
-            error = ""
-            if pdf_url:
-                title = w.get("display_name", "no-title")
-                doi_safe = doi or ""
-                basename = safe_filename(doi_safe or title) + ".pdf"
-                filepath = os.path.join(out_dir, basename)
-                ok, err = download_file_with_validation(pdf_url, filepath, headers=headers)
-                if ok:
-                    filename = filepath
-                    print(f"[{topic_name}] [{total}] Saved: {filepath}")
-                else:
-                    error = err or "download_failed"
-                    print(f"[{topic_name}] [{total}] Failed to download {pdf_url} => {error}")
+    # single-worker executor so the next page is in flight while the current
+    # page's PDFs are being resolved and downloaded
+    prefetcher = ThreadPoolExecutor(max_workers=1)
+    pending = prefetcher.submit(_fetch_works_page, session, dict(params), topic_name, 0.0)
+    csvfile = None
+    rows_written = 0
+    try:
+        while True:
+            page_count += 1
+            log.info("[%s] Querying cursor: %s (page %s)", topic_name, params.get("cursor"), page_count)
+            data = pending.result()
+
+            next_cursor = data.get("meta", {}).get("next_cursor")
+            if next_cursor and not (max_pages and page_count >= max_pages):
+                params["cursor"] = next_cursor
+                pending = prefetcher.submit(_fetch_works_page, session, dict(params), topic_name, sleep)
             else:
-                error = "no_pdf_url_found"
-                print(f"[{topic_name}] [{total}] No OA PDF/URL found for: {w.get('display_name')[:80]}")
-
-            topics_list = []
-            for t in (w.get("topics") or []):
-                try:
-                    topics_list.append(t.get("display_name") or t.get("id"))
-                except Exception:
-                    continue
-            b = w.get("biblio") or {}
-            journal = b.get("journal_title") or b.get("journal") or b.get("venue") or ""
-
-            writer.writerow({
-                "openalex_id": w.get("id", ""),
-                "title": w.get("display_name", ""),
-                "doi": doi or "",
-                "publication_date": w.get("publication_date", ""),
-                "pdf_url": pdf_url or "",
-                "saved_file": filename,
-                "error": error,
-                "topics": ";".join(topics_list),
-                "journal": journal or ""
-            })
-
-        next_cursor = data.get("meta", {}).get("next_cursor")
-        if not next_cursor:
-            print(f"[{topic_name}] No next cursor; finished paging.")
-            break
-        params["cursor"] = next_cursor
-        if max_pages and page_count >= max_pages:
-            print(f"[{topic_name}] Reached max_pages={max_pages}. Stopping.")
-            break
-        time.sleep(sleep)
-
-    print(f"[{topic_name}] Done. Total works processed: {total}")
-    print(f"[{topic_name}] Metadata CSV: {csv_path}")
+                pending = None
+
+            if writer is None:
+                csvfile = open(csv_path, "w", newline="", encoding="utf-8", buffering=1 << 20)
+                writer = csv.writer(csvfile)
+                writer.writerow(CSV_FIELDS)
+
+            results = data.get("results", [])
+            # resolve/download the page's works concurrently; the CSV writer is not
+            # thread-safe, so rows are written from this thread as workers finish
+            with ThreadPoolExecutor(max_workers=PAGE_WORKERS) as ex:
+                futures = [ex.submit(_process_work, w, total + i, out_dir, topic_name, email, session)
+                           for i, w in enumerate(results, start=1)]
+                for fut in as_completed(futures):
+                    writer.writerow(fut.result())
+                    rows_written += 1
+                    if rows_written % CSV_FLUSH_EVERY == 0:
+                        csvfile.flush()
+            total += len(results)
+
+            if pending is None:
+                if not next_cursor:
+                    log.info("[%s] No next cursor; finished paging.", topic_name)
+                else:
+                    log.info("[%s] Reached max_pages=%s. Stopping.", topic_name, max_pages)
+                break
+    finally:
+        if csvfile is not None:
+            csvfile.close()
+        prefetcher.shutdown()
+    log.info("[%s] Done. Total works processed: %s", topic_name, total)
+    log.info("[%s] Metadata CSV: %s", topic_name, csv_path)
     return True
 
+def _setup_logging():
+    """
+    Route log records through a queue: worker threads enqueue (cheap,
+    non-blocking) and a single QueueListener thread does the stderr writes,
+    so progress output never serializes the download workers. Returns the
+    listener; callers must stop() it to flush.
+    """
+    q = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(q, handler)
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(q))
+    listener.start()
+    return listener
+
 # ---------- CLI ----------
 def main():
     ap = argparse.ArgumentParser(description="Find OpenAlex topics for 'technology' and attempt OA PDF downloads for Zambia-affiliated works.")
@@ -356,38 +661,56 @@ def main():
     ap.add_argument("--max-topics", type=int, default=None, help="Optional: stop after this many topics processed")
     args = ap.parse_args()
 
-    candidates = fetch_candidate_topics(search_term=args.search_term, per_page=50, max_topics=args.top_n, email=args.email)
+    listener = _setup_logging()
+    try:
+        _run(args)
+    finally:
+        listener.stop()
+
+def _run(args):
+    session = make_session(args.email)
+    candidates = fetch_candidate_topics(search_term=args.search_term, per_page=50, max_topics=args.top_n, email=args.email, session=session)
     if not candidates:
-        print("No topics found; exiting.")
+        log.error("No topics found; exiting.")
         sys.exit(1)
 
-    print("\nCandidate topics (top by works_count):")
+    log.info("Candidate topics (top by works_count):")
     for i, t in enumerate(candidates, start=1):
-        print(f"{i}. {t.get('display_name')}  (id: {t.get('id')})  works_count: {t.get('works_count')}")
+        log.info("%s. %s  (id: %s)  works_count: %s", i, t.get("display_name"), t.get("id"), t.get("works_count"))
         kw = t.get("keywords") or []
         if kw:
-            print("    keywords:", ", ".join(kw[:8]))
+            log.info("    keywords: %s", ", ".join(kw[:8]))
 
     if args.list_only:
-        print("\nList-only mode; exiting.")
+        log.info("List-only mode; exiting.")
         return
 
-    processed = 0
-    for t in candidates:
+    todo = candidates[:args.max_topics] if args.max_topics else candidates
+    if args.max_topics and len(todo) < len(candidates):
+        log.info("Limiting to max_topics=%s.", args.max_topics)
+
+    def run_topic(t):
         tid = t.get("id") or ""
         if tid.startswith("https://openalex.org/"):
             tid = tid.split("/")[-1]
         tname = t.get("display_name") or tid
-        try:
-            download_for_topic(topic_id=tid, topic_name=tname, out_base=args.out, per_page=args.per_page, sleep=args.sleep, email=args.email, max_pages=args.max_pages)
-        except Exception as e:
-            print(f"Error for topic {tname} ({tid}): {e}")
-        processed += 1
-        if args.max_topics and processed >= args.max_topics:
-            print(f"Reached max_topics={args.max_topics}; stopping.")
-            break
+        # each topic gets its own session: concurrent use of one Session is
+        # not safe, and per-topic pools keep publishers isolated
+        download_for_topic(topic_id=tid, topic_name=tname, out_base=args.out, per_page=args.per_page, sleep=args.sleep, email=args.email, max_pages=args.max_pages, session=make_session(args.email))
+        return tname, tid
+
+    # topics are independent (own folder, own metadata.csv), so harvest them
+    # in parallel instead of serially
+    with ThreadPoolExecutor(max_workers=min(len(todo), 8)) as ex:
+        futures = {ex.submit(run_topic, t): t for t in todo}
+        for fut in as_completed(futures):
+            t = futures[fut]
+            try:
+                fut.result()
+            except Exception as e:
+                log.error("Error for topic %s (%s): %s", t.get("display_name"), t.get("id"), e)
 
-    print("\nAll done.")
+    log.info("All done.")
 
 if __name__ == "__main__":
     main()
@@ -14,13 +14,59 @@ Dependencies:
 """
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+import csv
+import os
 import requests
-import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import threading
 import pandas as pd
 import feedparser
 import re
+import string
 from urllib.parse import quote_plus
 
+try:
+    # drop-in Session subclass persisting responses to sqlite: repeated dev
+    # runs replay yesterday's API responses without touching the network
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
+
+try:
+    # multi-keyword matching for content-based sector labels: one linear
+    # scan over the text instead of sectors x keywords substring searches
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+    def _json_loads(raw):
+        return orjson.loads(raw)
+except ImportError:
+    import json
+    def _json_loads(raw):
+        return json.loads(raw)
+
+try:
+    # stream OpenAlex pages work-by-work instead of materializing the full
+    # decoded page (100 works with inverted indices can run to megabytes)
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    # lxml-based Atom parsing; an order of magnitude faster than feedparser's
+    # pure-Python parser on arXiv result pages
+    import fastfeedparser
+    def _parse_feed(content):
+        return fastfeedparser.parse(content)
+except ImportError:
+    def _parse_feed(content):
+        return feedparser.parse(content)
+
 # ---------- CONFIG: Vision2030 seed mapping (expand as needed) ----------
 VISION2030_MAP = {
     "Agriculture": ["agriculture", "farm", "crop", "irrigation", "livestock", "horticulture"],
@@ -38,299 +84,512 @@ VISION2030_MAP = {
     "Transport": ["transport", "logistics", "airport", "port", "shipping", "freight"],
     "Water_and_Sanitation": ["water", "sanitation", "wastewater", "hygiene", "drinking water"]
 }
+# sector -> bit position; 14 sectors fit comfortably in a 16-bit mask
+SECTOR_IDS = {name: i for i, name in enumerate(VISION2030_MAP)}
+# source -> bit position; three sources fit in a byte
+SOURCE_IDS = {"openalex": 0, "arxiv": 1, "core": 2}
+SECTOR_NAMES = tuple(VISION2030_MAP)
+
+# masks repeat heavily across rows (most records carry one or two bits), so
+# decoded strings are memoized instead of re-joined per row
+_sector_mask_strings = {}
+_source_mask_strings = {}
+
+def _decode_sector_mask(mask):
+    decoded = _sector_mask_strings.get(mask)
+    if decoded is None:
+        decoded = ";".join(sorted(n for b, n in enumerate(SECTOR_NAMES) if mask >> b & 1))
+        _sector_mask_strings[mask] = decoded
+    return decoded
+
+def _decode_source_mask(mask):
+    decoded = _source_mask_strings.get(mask)
+    if decoded is None:
+        decoded = ";".join(sorted(n for n, b in SOURCE_IDS.items() if mask >> b & 1))
+        _source_mask_strings[mask] = decoded
+    return decoded
 # ---------------------------------------------------------------------
 
 OPENALEX_WORKS_URL = "https://api.openalex.org/works"
 CORE_SEARCH_URL = "https://api.core.ac.uk/v3/search/works"  # requires core API key
 ARXIV_API = "http://export.arxiv.org/api/query"
 
+SECTOR_WORKERS = 8   # sectors harvested concurrently; remote rate limits cap the useful number
+PAGE_WORKERS = 4     # offset pages fetched concurrently per arXiv/CORE query
+
 HEADERS_TEMPLATE = "vision2030-harvester/1.0 ({email})"
 
+HTTP_CACHE = "vision2030_cache.sqlite"
+HTTP_CACHE_TTL = 86400   # a day: long enough for dev iteration, short enough to stay fresh
+
 # ---------- helpers ----------
+_thread_local = threading.local()
+
+def get_session(email=None):
+    """
+    Pooled Session for this thread. The OpenAlex cursor walk and CORE calls
+    hit the same hosts page after page, so keep-alive amortizes the TLS
+    handshake; the Retry policy absorbs 429s/5xxs. One Session per thread
+    because Sessions are not safe for concurrent use across the sector
+    workers.
+    """
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        if CachedSession is not None:
+            session = CachedSession(HTTP_CACHE, expire_after=HTTP_CACHE_TTL)
+        else:
+            session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=5, backoff_factor=0.5,
+                              status_forcelist=[429, 500, 502, 503, 504],
+                              respect_retry_after_header=True),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["User-Agent"] = HEADERS_TEMPLATE.format(email="no-email")
+        _thread_local.session = session
+    if email:
+        session.headers["User-Agent"] = HEADERS_TEMPLATE.format(email=email)
+    return session
+
 def safe_text(x):
     return (x or "").strip()
 
+# punctuation -> space, built once; translate + split/join run entirely in C
+_PUNCT_TABLE = str.maketrans({c: " " for c in string.punctuation})
+
 def normalize_title(title):
     """Lowercase, remove punctuation and extra whitespace for deduping fallback."""
     if not title:
         return ""
-    t = title.lower()
-    t = re.sub(r"[^\w\s]", " ", t)
-    t = re.sub(r"\s+", " ", t).strip()
-    return t
+    return " ".join(title.lower().translate(_PUNCT_TABLE).split())
+
+_sector_automaton = None
+
+def annotate_sectors(text):
+    """Return every sector with a keyword occurring in text (lowercased).
+    Uses a lazily built Aho-Corasick automaton over all ~80 keywords when
+    pyahocorasick is installed — O(len(text) + matches) — and falls back to
+    plain substring checks otherwise."""
+    global _sector_automaton
+    text = text.lower()
+    if ahocorasick is not None:
+        if _sector_automaton is None:
+            automaton = ahocorasick.Automaton()
+            for sector, kws in VISION2030_MAP.items():
+                for kw in kws:
+                    automaton.add_word(kw, sector)
+            automaton.make_automaton()
+            _sector_automaton = automaton
+        return {sector for _, sector in _sector_automaton.iter(text)}
+    return {sector for sector, kws in VISION2030_MAP.items()
+            if any(kw in text for kw in kws)}
+
+def _dedupe_key(item):
+    """Dedupe key for a harvested item: the lowered/stripped DOI when
+    present, else the normalized title. Computed once and cached on the item
+    so repeat passes never re-normalize."""
+    key = item.get("_key")
+    if key is None:
+        key = (item.get("doi") or "").lower().strip() or normalize_title(item.get("title") or "")
+        item["_key"] = key
+    return key
+
+def _rebuild_abstract(ai):
+    """Rebuild an abstract from OpenAlex's inverted index (token -> positions).
+    One flat (position, token) list sorted in C replaces the old dict keyed by
+    position plus a dense range() walk, which also raised on position gaps."""
+    pairs = [(p, tok) for tok, ps in ai.items() for p in ps]
+    pairs.sort()
+    return " ".join(tok for _, tok in pairs)
 
 # ---------- OpenAlex fetcher ----------
-def query_openalex(query, per_page=100, max_items=200, email=None):
+def query_openalex(query, per_page=100, max_items=200, email=None, select_fields=None, include_abstract=False):
     """
     Query OpenAlex works search using 'search' parameter (searches title+abstract) and return list of work dicts.
     We'll page using cursor-based pagination until max_items or end.
+
+    select_fields narrows the response; the default asks only for what this
+    harvester exports. abstract_inverted_index is usually the largest field
+    by far, so it is excluded unless include_abstract is set — callers that
+    do not need abstracts skip both the transfer and the reconstruction.
     """
-    select_fields = ",".join([
-        "id", "doi", "display_name", "abstract_inverted_index", "publication_date",
-        "best_oa_location", "primary_location", "locations", "topics", "biblio", "open_access"
-    ])
-    results = []
+    if select_fields is None:
+        select_fields = [
+            "id", "doi", "display_name", "publication_date",
+            "best_oa_location", "primary_location", "topics", "biblio"
+        ]
+    if include_abstract and "abstract_inverted_index" not in select_fields:
+        select_fields = list(select_fields) + ["abstract_inverted_index"]
     params = {
         "search": query,
         "per-page": per_page,
-        "select": select_fields,
+        "select": ",".join(select_fields),
         "cursor": "*"
     }
-    headers = {"User-Agent": HEADERS_TEMPLATE.format(email=email or "no-email")}
-    while True:
-        r = requests.get(OPENALEX_WORKS_URL, params=params, headers=headers, timeout=60)
-        if r.status_code != 200:
-            print("OpenAlex request failed:", r.status_code, r.text[:200])
-            break
-        data = r.json()
-        page_results = data.get("results", [])
-        results.extend(page_results)
-        if len(results) >= max_items:
-            results = results[:max_items]
-            break
-        next_cursor = data.get("meta", {}).get("next_cursor")
+    session = get_session(email)
+    output = []
+    while len(output) < max_items:
+        if ijson is not None:
+            with session.get(OPENALEX_WORKS_URL, params=params, timeout=60, stream=True) as r:
+                if r.status_code != 200:
+                    print("OpenAlex request failed:", r.status_code, r.text[:200])
+                    break
+                r.raw.decode_content = True
+                next_cursor = _stream_openalex_page(
+                    r.raw, lambda w: output.append(_extract_openalex_work(w)))
+        else:
+            r = session.get(OPENALEX_WORKS_URL, params=params, timeout=60)
+            if r.status_code != 200:
+                print("OpenAlex request failed:", r.status_code, r.text[:200])
+                break
+            data = _json_loads(r.content)
+            for w in data.get("results", []):
+                output.append(_extract_openalex_work(w))
+            next_cursor = data.get("meta", {}).get("next_cursor")
         if not next_cursor:
             break
         params["cursor"] = next_cursor
-        time.sleep(0.5)
-    # Normalize extracted fields
-    output = []
-    for w in results:
-        doi = w.get("doi") or ""
-        title = w.get("display_name") or ""
-        # reconstruct abstract from inverted index if present
-        abstract = ""
-        ai = w.get("abstract_inverted_index")
-        if ai:
-            # technique from OpenAlex docs: join tokens in order of positions
-            # inverted index: word->list of positions
-            try:
-                positions = {}
-                for token, poslist in ai.items():
-                    for p in poslist:
-                        positions[p] = token
-                abstract = " ".join(positions[i] for i in range(max(positions.keys())+1))
-            except Exception:
-                abstract = ""
-        pub_date = w.get("publication_date") or ""
-        # pdf candidate
-        pdf = None
-        bol = w.get("best_oa_location") or {}
-        pdf = bol.get("url") or bol.get("url_for_pdf") or bol.get("pdf_url") or None
-        if not pdf:
-            pl = w.get("primary_location") or {}
-            pdf = pl.get("url") or pl.get("pdf_url") or None
-        topics = [t.get("display_name") for t in (w.get("topics") or []) if t.get("display_name")]
-        host = (w.get("biblio") or {}).get("journal_title") or (w.get("biblio") or {}).get("journal") or ""
-        output.append({
-            "source": "openalex",
-            "id": w.get("id"),
-            "doi": doi,
-            "title": title,
-            "abstract": abstract,
-            "authors": "",  # authors omitted in this select; could fetch if needed
-            "published": pub_date,
-            "pdf_url": pdf,
-            "topics": ";".join(topics),
-            "journal": host
-        })
+    del output[max_items:]
     return output
 
+def _stream_openalex_page(stream, sink):
+    """Incrementally parse one OpenAlex page: each element of 'results' is
+    assembled and handed to sink as soon as its bytes arrive, so only one
+    work's object graph is alive at a time. Returns meta.next_cursor."""
+    next_cursor = None
+    builder = None
+    for prefix, event, value in ijson.parse(stream):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == "results.item" and event == "end_map":
+                sink(builder.value)
+                builder = None
+        elif prefix == "results.item" and event == "start_map":
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+        elif prefix == "meta.next_cursor":
+            next_cursor = value
+    return next_cursor
+
+def _extract_openalex_work(w):
+    """Normalize one OpenAlex work dict into the harvester's record shape."""
+    doi = w.get("doi") or ""
+    title = w.get("display_name") or ""
+    # reconstruct abstract from inverted index if present
+    abstract = ""
+    ai = w.get("abstract_inverted_index")
+    if ai:
+        try:
+            abstract = _rebuild_abstract(ai)
+        except Exception:
+            abstract = ""
+    pub_date = w.get("publication_date") or ""
+    # pdf candidate
+    bol = w.get("best_oa_location") or {}
+    pdf = bol.get("url") or bol.get("url_for_pdf") or bol.get("pdf_url") or None
+    if not pdf:
+        pl = w.get("primary_location") or {}
+        pdf = pl.get("url") or pl.get("pdf_url") or None
+    topics = [t.get("display_name") for t in (w.get("topics") or []) if t.get("display_name")]
+    host = (w.get("biblio") or {}).get("journal_title") or (w.get("biblio") or {}).get("journal") or ""
+    return {
+        "source": "openalex",
+        "id": w.get("id"),
+        "doi": doi,
+        "title": title,
+        "abstract": abstract,
+        "authors": "",  # authors omitted in this select; could fetch if needed
+        "published": pub_date,
+        "pdf_url": pdf,
+        "topics": ";".join(topics),
+        "journal": host
+    }
+
 # ---------- arXiv fetcher ----------
+def _extract_arxiv_entry(e):
+    """Normalize one arXiv Atom entry into the harvester's record shape."""
+    # entry.id like http://arxiv.org/abs/xxxx
+    entry_id = e.get("id", "")
+    title = safe_text(e.get("title", ""))
+    abstract = safe_text(e.get("summary", ""))
+    published = e.get("published", "")
+    # explicit pdf link if the feed carries one; otherwise left empty here
+    # and constructed from the abs URL in one vectorized pass per page
+    pdf_link = None
+    for l in e.get("links", []):
+        if l.get("type") == "application/pdf":
+            pdf_link = l.get("href")
+            break
+    authors = ";".join([a.get("name","") for a in (e.get("authors") or [])])
+    return {
+        "source": "arxiv",
+        "id": entry_id,
+        "doi": "",  # arXiv may have DOI but not always; feedparser can include it in links sometimes
+        "title": title,
+        "abstract": abstract,
+        "authors": authors,
+        "published": published,
+        "pdf_url": pdf_link,
+        "topics": "",  # arXiv categories not parsed here
+        "journal": "arXiv"
+    }
+
+def _fetch_arxiv_page(query, start, n):
+    q = f"search_query=all:{quote_plus(query)}&start={start}&max_results={n}"
+    url = ARXIV_API + "?" + q
+    # fetch the bytes ourselves (keeps HTTP under our control) and hand
+    # them to whichever parser is available
+    r = get_session().get(url, timeout=60)
+    if r.status_code != 200:
+        print("arXiv request failed:", r.status_code)
+        return []
+    feed = _parse_feed(r.content)
+    entries = [_extract_arxiv_entry(e) for e in feed.entries]
+    # fill missing pdf links for the whole page in one C-level string pass;
+    # abs URLs never end in .pdf, so the suffix is appended unconditionally
+    missing = [rec for rec in entries if not rec["pdf_url"] and rec["id"]]
+    if missing:
+        pdfs = pd.Series([rec["id"] for rec in missing]).str.replace(
+            "/abs/", "/pdf/", regex=False) + ".pdf"
+        for rec, pdf in zip(missing, pdfs):
+            rec["pdf_url"] = pdf
+    return entries
+
 def query_arxiv(query, max_results=100):
     """
     Query arXiv via their API (Atom feed). Returns list of dicts with metadata and pdf link.
     query is a simple keyword phrase used as all:<query>
+
+    Unlike the OpenAlex cursor walk, arXiv pages are addressed by start=
+    offset, so they carry no data dependency on each other — all offsets are
+    known up front and fetched concurrently (bounded, to stay polite).
     """
-    out = []
+    if max_results <= 0:
+        # small --per-sector values divide down to 0 in harvest_all
+        return []
     batch = 100 if max_results > 100 else max_results
-    start = 0
-    while start < max_results:
-        n = min(batch, max_results - start)
-        q = f"search_query=all:{quote_plus(query)}&start={start}&max_results={n}"
-        url = ARXIV_API + "?" + q
-        feed = feedparser.parse(url)
-        if not feed.entries:
-            break
-        for e in feed.entries:
-            # entry.id like http://arxiv.org/abs/xxxx
-            entry_id = e.get("id", "")
-            title = safe_text(e.get("title", ""))
-            abstract = safe_text(e.get("summary", ""))
-            published = e.get("published", "")
-            # try to find pdf link among links or construct from id
-            pdf_link = None
-            for l in e.get("links", []):
-                if l.get("type") == "application/pdf":
-                    pdf_link = l.get("href")
-                    break
-            if not pdf_link and entry_id:
-                # construct: replace /abs/ with /pdf/ and append .pdf if absent
-                pdf_link = entry_id.replace("/abs/", "/pdf/")
-                if not pdf_link.endswith(".pdf"):
-                    pdf_link = pdf_link + ".pdf"
-            authors = ";".join([a.get("name","") for a in (e.get("authors") or [])])
-            out.append({
-                "source": "arxiv",
-                "id": entry_id,
-                "doi": "",  # arXiv may have DOI but not always; feedparser can include it in links sometimes
-                "title": title,
-                "abstract": abstract,
-                "authors": authors,
-                "published": published,
-                "pdf_url": pdf_link,
-                "topics": "",  # arXiv categories not parsed here
-                "journal": "arXiv"
-            })
-        start += n
-        time.sleep(0.5)
+    offsets = [(start, min(batch, max_results - start))
+               for start in range(0, max_results, batch)]
+    pages = []
+    with ThreadPoolExecutor(max_workers=max(1, min(len(offsets), PAGE_WORKERS))) as ex:
+        futures = [ex.submit(_fetch_arxiv_page, query, start, n) for start, n in offsets]
+        for fut in futures:
+            pages.append(fut.result())
+    out = []
+    for page in pages:
+        if not page:
+            break  # past the end of the result set
+        out.extend(page)
     return out
 
 # ---------- CORE fetcher (optional) ----------
+def _fetch_core_page(query, api_key, page, page_size):
+    headers = {"Authorization": api_key}
+    params = {"q": query, "page": page, "pageSize": page_size}
+    r = get_session().get(CORE_SEARCH_URL, headers=headers, params=params, timeout=60)
+    if r.status_code != 200:
+        print("CORE request failed:", r.status_code, r.text[:200])
+        return []
+    data = _json_loads(r.content)
+    return data.get("results") or []
+
 def query_core(query, api_key, max_results=100):
     """
     Query CORE (requires an API key). Returns list of dicts. If no key provided, returns [].
+    CORE uses numeric page offsets, so like arXiv the pages are fetched
+    concurrently; previously only the first page was ever requested.
     """
-    if not api_key:
+    if not api_key or max_results <= 0:
         return []
+    page_size = 100 if max_results > 100 else max_results
+    n_pages = (max_results + page_size - 1) // page_size
+    pages = []
+    with ThreadPoolExecutor(max_workers=max(1, min(n_pages, PAGE_WORKERS))) as ex:
+        futures = [ex.submit(_fetch_core_page, query, api_key, page, page_size)
+                   for page in range(1, n_pages + 1)]
+        for fut in futures:
+            pages.append(fut.result())
     out = []
-    per_page = 100 if max_results > 100 else max_results
-    url = CORE_SEARCH_URL
-    headers = {"Authorization": api_key}
-    params = {"q": query, "page": 1, "pageSize": per_page}
-    r = requests.get(url, headers=headers, params=params, timeout=60)
-    if r.status_code != 200:
-        print("CORE request failed:", r.status_code, r.text[:200])
-        return []
-    data = r.json()
-    docs = data.get("results") or []
-    for d in docs:
-        # CORE fields differ by provider; common: id, title, authors, year, downloadUrl
-        doi = d.get("doi") or ""
-        title = safe_text(d.get("title") or "")
-        abstract = safe_text(d.get("abstract") or "")
-        authors = ";".join(d.get("authors") or [])
-        published = d.get("year") or ""
-        pdf = d.get("downloadUrl") or ""
-        out.append({
-            "source": "core",
-            "id": d.get("id"),
-            "doi": doi,
-            "title": title,
-            "abstract": abstract,
-            "authors": authors,
-            "published": published,
-            "pdf_url": pdf,
-            "topics": ";".join(d.get("tags") or []),
-            "journal": d.get("journalTitle") or ""
-        })
-    return out
+    for docs in pages:
+        if not docs:
+            break
+        for d in docs:
+            # CORE fields differ by provider; common: id, title, authors, year, downloadUrl
+            doi = d.get("doi") or ""
+            title = safe_text(d.get("title") or "")
+            abstract = safe_text(d.get("abstract") or "")
+            authors = ";".join(d.get("authors") or [])
+            published = d.get("year") or ""
+            pdf = d.get("downloadUrl") or ""
+            out.append({
+                "source": "core",
+                "id": d.get("id"),
+                "doi": doi,
+                "title": title,
+                "abstract": abstract,
+                "authors": authors,
+                "published": published,
+                "pdf_url": pdf,
+                "topics": ";".join(d.get("tags") or []),
+                "journal": d.get("journalTitle") or ""
+            })
+    return out[:max_results]
 
 # ---------- Orchestration ----------
-def harvest_all(out_csv, per_sector=200, core_key=None, email=None):
-    seen = {}  # key -> record (dedupe by doi or normalized title)
-    rows = []
-    total_queries = 0
-
-    for sector, keywords in VISION2030_MAP.items():
-        # form a compact query phrase (join keywords with OR for robustness in OpenAlex; but we use simple search)
-        # We'll query using the most representative keyword(s) (first 2)
-        qs = keywords[:2] if len(keywords) >= 2 else keywords
-        # build a search phrase; simple approach: join with space (OpenAlex 'search' matches title/abstract)
-        query_phrase = " ".join(qs)
-        print(f"\n=== Harvest sector: {sector} using query: '{query_phrase}' ===")
-
-        # 1) OpenAlex
-        open_items = query_openalex(query_phrase, per_page=100, max_items=per_sector, email=email)
-        print(f"OpenAlex returned {len(open_items)} items for {sector}")
-        for item in open_items:
-            key = (item.get("doi") or "").lower().strip()
-            if not key:
-                key = normalize_title(item.get("title") or "")
-            if not key:
-                continue
-            if key in seen:
-                # append sector candidate to provenance for later analysis
-                seen[key]["assigned_sectors"].add(sector)
-                seen[key]["sources"].add("openalex")
-            else:
-                rec = dict(item)
-                rec["assigned_sectors"] = set([sector])
-                rec["sources"] = set(["openalex"])
-                rec["query_sector"] = sector
-                rows.append(rec)
-                seen[key] = rec
-
-        time.sleep(0.5)
-
-        # 2) arXiv
-        arxiv_items = query_arxiv(query_phrase, max_results=int(per_sector/4))  # arXiv smaller per sector
-        print(f"arXiv returned {len(arxiv_items)} items for {sector}")
-        for item in arxiv_items:
-            key = (item.get("doi") or "").lower().strip()
-            if not key:
-                key = normalize_title(item.get("title") or "")
-            if not key:
-                continue
-            if key in seen:
-                seen[key]["assigned_sectors"].add(sector)
-                seen[key]["sources"].add("arxiv")
-            else:
-                rec = dict(item)
-                rec["assigned_sectors"] = set([sector])
-                rec["sources"] = set(["arxiv"])
-                rec["query_sector"] = sector
-                rows.append(rec)
-                seen[key] = rec
-
-        time.sleep(0.5)
-
-        # 3) CORE (optional)
-        if core_key:
-            core_items = query_core(query_phrase, core_key, max_results=int(per_sector/2))
-            print(f"CORE returned {len(core_items)} items for {sector}")
-            for item in core_items:
-                key = (item.get("doi") or "").lower().strip()
-                if not key:
-                    key = normalize_title(item.get("title") or "")
-                if not key:
+def _harvest_sector(sector, keywords, per_sector, core_key, email):
+    """Fetch all sources for one sector. Returns (sector, [(source, items), ...]).
+    Runs on a worker thread; everything here is network-bound."""
+    # form a compact query phrase (join keywords with OR for robustness in OpenAlex; but we use simple search)
+    # We'll query using the most representative keyword(s) (first 2)
+    qs = keywords[:2] if len(keywords) >= 2 else keywords
+    # build a search phrase; simple approach: join with space (OpenAlex 'search' matches title/abstract)
+    query_phrase = " ".join(qs)
+    print(f"=== Harvest sector: {sector} using query: '{query_phrase}' ===")
+
+    # abstracts feed the exported corpus (and later content labeling), so
+    # this caller opts in; drop the flag to harvest metadata-only much faster
+    open_items = query_openalex(query_phrase, per_page=100, max_items=per_sector, email=email, include_abstract=True)
+    print(f"OpenAlex returned {len(open_items)} items for {sector}")
+
+    arxiv_items = query_arxiv(query_phrase, max_results=int(per_sector/4))  # arXiv smaller per sector
+    print(f"arXiv returned {len(arxiv_items)} items for {sector}")
+
+    core_items = []
+    if core_key:
+        core_items = query_core(query_phrase, core_key, max_results=int(per_sector/2))
+        print(f"CORE returned {len(core_items)} items for {sector}")
+
+    return sector, [("openalex", open_items), ("arxiv", arxiv_items), ("core", core_items)]
+
+RECORD_FIELDS = ("source", "id", "doi", "title", "abstract", "authors",
+                 "published", "pdf_url", "topics", "journal")
+
+def _merge_items(items, sector, sector_bit, source_bit,
+                 seen, cols, query_sectors, sector_masks, source_masks):
+    """Fold one source's items for one sector into the column buffers,
+    deduplicating by key. Hot-loop attributes are bound to locals once."""
+    seen_get = seen.get
+    col_appends = [cols[f].append for f in RECORD_FIELDS]
+    for item in items:
+        key = _dedupe_key(item)
+        if not key:
+            continue
+        idx = seen_get(key)
+        if idx is not None:
+            # duplicate: just flip the sector and source bits
+            sector_masks[idx] |= sector_bit
+            source_masks[idx] |= source_bit
+        else:
+            seen[key] = len(sector_masks)
+            get = item.get
+            for f, append in zip(RECORD_FIELDS, col_appends):
+                append(get(f) or "")
+            query_sectors.append(sector)
+            sector_masks.append(sector_bit)
+            source_masks.append(source_bit)
+
+def harvest_all(out_csv, per_sector=200, core_key=None, email=None, out_format="csv"):
+    # struct-of-arrays accumulation: one list per output column plus a
+    # uint16 sector bitmask and a source set per row. Compared with a dict +
+    # two sets per record this cuts hundreds of bytes of per-row overhead
+    # and hands pandas ready-made columns at the end.
+    cols = {f: [] for f in RECORD_FIELDS}
+    query_sectors = []
+    sector_masks = []
+    source_masks = []
+    seen = {}  # dedupe key (doi or normalized title) -> row index
+
+    def _decode_row(i):
+        row = [cols[f][i] for f in RECORD_FIELDS]
+        row.append(_decode_sector_mask(sector_masks[i]))
+        row.append(_decode_source_mask(source_masks[i]))
+        row.append(query_sectors[i])
+        t, a = cols["title"][i], cols["abstract"][i]
+        row.append(";".join(sorted(annotate_sectors(t + " " + a))) if (t or a) else "")
+        return row
+
+    # fetch phase: the 14 sectors are independent, so their queries fan out
+    # across threads; results are gathered in submission order so the merge
+    # stays deterministic and single-threaded (no locking on seen). Each
+    # sector is merged and flushed as soon as its future resolves, so its
+    # raw item lists are released instead of accumulating until the end,
+    # and a crash mid-harvest still leaves the rows so far on disk. The
+    # flush goes to a .partial sidecar — its rows go stale when later
+    # sectors re-tag earlier ones — and is removed once the authoritative
+    # write below succeeds.
+    header = list(RECORD_FIELDS) + ["assigned_sectors", "provenance_sources",
+                                    "query_sector", "content_sectors"]
+    partial_path = out_csv + ".partial"
+    flushed = 0
+    sectors = list(VISION2030_MAP.items())
+    with open(partial_path, "w", newline="", encoding="utf-8") as partial:
+        pwriter = csv.writer(partial)
+        pwriter.writerow(header)
+        with ThreadPoolExecutor(max_workers=min(len(sectors), SECTOR_WORKERS)) as ex:
+            futures = [ex.submit(_harvest_sector, sector, kws, per_sector, core_key, email)
+                       for sector, kws in sectors]
+            for fut in futures:
+                try:
+                    sector, source_items = fut.result()
+                except Exception as e:
+                    print("Sector harvest failed:", e)
                     continue
-                if key in seen:
-                    seen[key]["assigned_sectors"].add(sector)
-                    seen[key]["sources"].add("core")
-                else:
-                    rec = dict(item)
-                    rec["assigned_sectors"] = set([sector])
-                    rec["sources"] = set(["core"])
-                    rec["query_sector"] = sector
-                    rows.append(rec)
-                    seen[key] = rec
-
-        total_queries += 1
-
-    # Finalize rows: flatten assigned_sectors and sources to strings, prepare dataframe
-    final_rows = []
-    for rec in rows:
-        rr = {
-            "source": rec.get("source", ""),
-            "id": rec.get("id", ""),
-            "doi": rec.get("doi", ""),
-            "title": rec.get("title", ""),
-            "abstract": rec.get("abstract", ""),
-            "authors": rec.get("authors", ""),
-            "published": rec.get("published", ""),
-            "pdf_url": rec.get("pdf_url", ""),
-            "topics": rec.get("topics", ""),
-            "journal": rec.get("journal", ""),
-            "assigned_sectors": ";".join(sorted(list(rec.get("assigned_sectors") or []))),
-            "provenance_sources": ";".join(sorted(list(rec.get("sources") or []))),
-            "query_sector": rec.get("query_sector", "")
-        }
-        final_rows.append(rr)
-
-    df = pd.DataFrame(final_rows)
-    df.to_csv(out_csv, index=False, encoding="utf-8")
-    print(f"\nWrote {len(df)} deduplicated records to {out_csv}")
+                sector_bit = 1 << SECTOR_IDS[sector]
+                for source, items in source_items:
+                    _merge_items(items, sector, sector_bit, 1 << SOURCE_IDS[source],
+                                 seen, cols, query_sectors, sector_masks, source_masks)
+                # rows later sectors merely re-tag (bitmask OR) are corrected
+                # by the authoritative rewrite below
+                for i in range(flushed, len(sector_masks)):
+                    pwriter.writerow(_decode_row(i))
+                flushed = len(sector_masks)
+                partial.flush()
+
+    # decode masks/sets to the exported string columns and build the frame
+    # straight from columns — no per-row dict pass
+    frame_cols = dict(cols)
+    frame_cols["assigned_sectors"] = [_decode_sector_mask(m) for m in sector_masks]
+    frame_cols["provenance_sources"] = [_decode_source_mask(m) for m in source_masks]
+    frame_cols["query_sector"] = query_sectors
+    # assigned_sectors only records which queries returned an item; this is a
+    # real multi-label pass over the text itself, so a paper matching several
+    # sectors' keywords carries all of them
+    frame_cols["content_sectors"] = [
+        ";".join(sorted(annotate_sectors(t + " " + a))) if (t or a) else ""
+        for t, a in zip(cols["title"], cols["abstract"])
+    ]
+
+    df = pd.DataFrame(frame_cols)
+    try:
+        # every column is text; Arrow-backed strings hold them at roughly
+        # half the footprint of object-dtype Python strings
+        df = df.astype("string[pyarrow]")
+    except (ImportError, TypeError):
+        pass
+    # these columns repeat a handful of values corpus-wide; category dtype
+    # stores each distinct string once plus small integer codes, which pays
+    # off for in-memory work and for the columnar export formats
+    for col in ("source", "journal", "query_sector", "assigned_sectors", "provenance_sources"):
+        df[col] = df[col].astype("category")
+    # CSV stays the default for compatibility; parquet/feather write faster,
+    # compress far better and round-trip the dtypes above losslessly
+    if out_format == "parquet":
+        out_path = re.sub(r"\.csv$", "", out_csv) + ".parquet"
+        df.to_parquet(out_path, engine="pyarrow", compression="snappy")
+    elif out_format == "feather":
+        out_path = re.sub(r"\.csv$", "", out_csv) + ".feather"
+        df.to_feather(out_path)
+    else:
+        out_path = out_csv
+        df.to_csv(out_path, index=False, encoding="utf-8")
+    try:
+        os.unlink(partial_path)
+    except OSError:
+        pass
+    print(f"\nWrote {len(df)} deduplicated records to {out_path}")
     return df
 
 # ---------- CLI ----------
@@ -340,9 +599,11 @@ def main():
     ap.add_argument("--per-sector", type=int, default=200, help="Target items per sector (OpenAlex).")
     ap.add_argument("--core-key", default=None, help="Optional CORE API key")
     ap.add_argument("--email", default=None, help="Optional contact email for polite user-agent")
+    ap.add_argument("--format", choices=["csv", "parquet", "feather"], default="csv",
+                    help="Output format (parquet/feather are smaller and faster to write/read)")
     args = ap.parse_args()
 
-    harvest_all(out_csv=args.out, per_sector=args.per_sector, core_key=args.core_key, email=args.email)
+    harvest_all(out_csv=args.out, per_sector=args.per_sector, core_key=args.core_key, email=args.email, out_format=args.format)
 
 if __name__ == "__main__":
     main()